@@ -24,6 +24,11 @@ from typing import Any, Dict, Iterator, List, Optional, Union
 
 import requests
 
+try:  # Optional speed-up: ``pip install easytrans-sdk[fast]``
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    _orjson = None  # type: ignore[assignment]
+
 from easytrans.models import (
     Customer,
     CustomerResult,
@@ -519,13 +524,26 @@ class EasyTransClient:
         self._handle_rest_error(response)
 
         try:
-            return response.json()
+            return self._decode_json(response)
         except ValueError as exc:
             raise EasyTransAPIError(
                 f"Invalid JSON in REST response: {exc}\n"
                 f"Response: {response.text[:200]}"
             ) from exc
 
+    @staticmethod
+    def _decode_json(response: requests.Response) -> Any:
+        """
+        Decode a REST response body.
+
+        Parses the raw bytes with :mod:`orjson` when it is installed and
+        falls back to ``response.json()`` otherwise. Both raise a
+        ``ValueError`` subclass on malformed JSON.
+        """
+        if _orjson is not None:
+            return _orjson.loads(response.content)
+        return response.json()
+
     def _handle_rest_error(self, response: requests.Response) -> None:
         """
         Raise the appropriate exception for a REST API 4xx/5xx response.
@@ -596,11 +614,12 @@ class EasyTransClient:
             Individual resource objects of type ``item_cls``.
         """
         while True:
-            raw = self._make_rest_request("GET", path, params=params)
-            for item in raw.get("data", []):
-                yield item_cls.from_dict(item)
+            page = PagedResponse.from_dict(
+                self._make_rest_request("GET", path, params=params), item_cls
+            )
+            yield from page.data
 
-            next_url = (raw.get("links") or {}).get("next")
+            next_url = page.next_url
             if not next_url:
                 break
 
@@ -8,10 +8,17 @@ All models are implemented as dataclasses with:
 - Optional field validation in __post_init__()
 """
 
+import sys
 from dataclasses import dataclass, field, asdict
 from typing import List, Dict, Optional, Any, Union
 from datetime import datetime
 
+# Models are built in bulk (per shipment/contact here, per API record in
+# rest_models), so store their fields in slots rather than a per-instance
+# ``__dict__`` where the interpreter allows it (``dataclass(slots=True)`` is
+# Python 3.10+). Shared with ``rest_models`` so both model layers stay in step.
+_MODEL_OPTIONS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 def _clean_dict(data: Dict[str, Any], remove_none: bool = True) -> Dict[str, Any]:
     """
@@ -53,7 +60,7 @@ class Document:
         return cls(**data)
 
 
-@dataclass
+@dataclass(**_MODEL_OPTIONS)
 class Destination:
     """
     Order destination (pickup or delivery address).
@@ -99,7 +106,7 @@ class Destination:
         return cls(**data)
 
 
-@dataclass
+@dataclass(**_MODEL_OPTIONS)
 class Package:
     """
     Package/goods line for an order.
@@ -128,7 +135,7 @@ class Package:
         return cls(**data)
 
 
-@dataclass
+@dataclass(**_MODEL_OPTIONS)
 class Order:
     """
     Transport order with destinations and packages.
@@ -193,7 +200,7 @@ class Order:
         return cls(**data)
 
 
-@dataclass
+@dataclass(**_MODEL_OPTIONS)
 class CustomerContact:
     """
     Contact person for a customer.
@@ -223,7 +230,7 @@ class CustomerContact:
         return cls(**data)
 
 
-@dataclass
+@dataclass(**_MODEL_OPTIONS)
 class Customer:
     """
     Customer entity with address and contact information.
@@ -4,7 +4,8 @@ Response models for the EasyTrans REST API (``/api/v1/``).
 All models are read-only dataclasses that mirror the OpenAPI schema returned
 by the REST endpoints. They are populated via their ``from_dict()`` class
 methods and are never serialised back to JSON (use the client's keyword
-arguments for write operations instead).
+arguments for write operations instead). Collection fields are tuples, so
+the nested response data cannot be mutated in place.
 
 Naming convention:
   - ``Rest`` prefix avoids name collisions with the existing JSON-import
@@ -16,8 +17,11 @@ Naming convention:
 from __future__ import annotations
 
 import datetime
+import types
 from dataclasses import dataclass, field
-from typing import Any, Dict, Generic, List, Optional, TypeVar, Union
+from typing import Any, Dict, Generic, List, Mapping, Optional, Tuple, TypeVar, Union
+
+from easytrans.models import _MODEL_OPTIONS
 
 
 # ---------------------------------------------------------------------------
@@ -26,8 +30,13 @@ from typing import Any, Dict, Generic, List, Optional, TypeVar, Union
 
 T = TypeVar("T")
 
+# Shared fallback for absent sub-objects (``data.get("links") or _EMPTY``).
+# A read-only proxy, so the one instance shared by every from_dict() call
+# cannot be mutated by accident.
+_EMPTY: Mapping[str, Any] = types.MappingProxyType({})
+
 
-@dataclass
+@dataclass(**_MODEL_OPTIONS)
 class PaginationLinks:
     """Pagination cursor links returned with every list response."""
 
@@ -37,7 +46,7 @@ class PaginationLinks:
     next: Optional[str] = None
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "PaginationLinks":
+    def from_dict(cls, data: Mapping[str, Any]) -> "PaginationLinks":
         return cls(
             first=data.get("first"),
             last=data.get("last"),
@@ -46,7 +55,7 @@ class PaginationLinks:
         )
 
 
-@dataclass
+@dataclass(**_MODEL_OPTIONS)
 class PaginationMeta:
     """Pagination metadata returned with every list response."""
 
@@ -58,7 +67,7 @@ class PaginationMeta:
     to_record: Optional[int] = None
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "PaginationMeta":
+    def from_dict(cls, data: Mapping[str, Any]) -> "PaginationMeta":
         return cls(
             current_page=data.get("current_page", 1),
             last_page=data.get("last_page", 1),
@@ -69,7 +78,6 @@ class PaginationMeta:
         )
 
 
-@dataclass
 class PagedResponse(Generic[T]):
     """
     Generic paginated list response wrapper.
@@ -78,12 +86,34 @@ class PagedResponse(Generic[T]):
     Iterate pages by passing the ``links.next`` URL back to the
     same client method with the ``page`` parameter, or let the
     ``_iter_pages`` helper handle it automatically.
+
+    ``links`` and ``meta`` are built from the raw response on first
+    access, so callers that only iterate ``data`` never construct them.
+    ``next_url`` reads ``links.next`` without building either.
+
+    Unlike the other REST models this is a plain slotted class, not a
+    dataclass: ``dataclasses.asdict()``, ``fields()`` and ``replace()``
+    do not accept it. Equality and ``repr`` behave as before.
     """
 
-    data: List[T]
-    links: PaginationLinks
-    meta: PaginationMeta
-    has_next: bool = False
+    __slots__ = ("data", "has_next", "_links", "_meta", "_links_raw", "_meta_raw")
+
+    def __init__(
+        self,
+        data: List[T],
+        links: Optional[PaginationLinks] = None,
+        meta: Optional[PaginationMeta] = None,
+        has_next: bool = False,
+        *,
+        _links_raw: Optional[Mapping[str, Any]] = None,
+        _meta_raw: Optional[Mapping[str, Any]] = None,
+    ) -> None:
+        self.data = data
+        self.has_next = has_next
+        self._links = links
+        self._meta = meta
+        self._links_raw: Mapping[str, Any] = _links_raw or _EMPTY
+        self._meta_raw: Mapping[str, Any] = _meta_raw or _EMPTY
 
     @classmethod
     def from_dict(
@@ -91,14 +121,48 @@ class PagedResponse(Generic[T]):
         raw: Dict[str, Any],
         item_cls: Any,
     ) -> "PagedResponse[Any]":
-        links = PaginationLinks.from_dict(raw.get("links") or {})
-        meta = PaginationMeta.from_dict(raw.get("meta") or {})
-        data = [item_cls.from_dict(item) for item in raw.get("data", [])]
+        links_raw = raw.get("links") or _EMPTY
         return cls(
-            data=data,
-            links=links,
-            meta=meta,
-            has_next=bool(links.next),
+            data=list(map(item_cls.from_dict, raw.get("data") or ())),
+            has_next=bool(links_raw.get("next")),
+            _links_raw=links_raw,
+            _meta_raw=raw.get("meta"),
+        )
+
+    @property
+    def links(self) -> PaginationLinks:
+        """Pagination links, parsed from the raw response on first access."""
+        if self._links is None:
+            self._links = PaginationLinks.from_dict(self._links_raw)
+        return self._links
+
+    @property
+    def meta(self) -> PaginationMeta:
+        """Pagination metadata, parsed from the raw response on first access."""
+        if self._meta is None:
+            self._meta = PaginationMeta.from_dict(self._meta_raw)
+        return self._meta
+
+    @property
+    def next_url(self) -> Optional[str]:
+        """URL of the next page (``links.next``) without building :attr:`links`."""
+        if self._links is not None:
+            return self._links.next
+        return self._links_raw.get("next")
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PagedResponse):
+            return NotImplemented
+        return (self.data, self.links, self.meta, self.has_next) == (
+            other.data, other.links, other.meta, other.has_next
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(data={self.data!r}, links={self.links!r}, "
+            f"meta={self.meta!r}, has_next={self.has_next!r})"
         )
 
 
@@ -106,7 +170,7 @@ class PagedResponse(Generic[T]):
 # Shared sub-models
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(**_MODEL_OPTIONS)
 class RestAddress:
     """Business or mailing address block."""
 
@@ -131,7 +195,7 @@ class RestAddress:
         )
 
 
-@dataclass
+@dataclass(**_MODEL_OPTIONS)
 class RestMailingAddress(RestAddress):
     """Mailing address block — extends RestAddress with an ``attn`` field."""
 
@@ -152,7 +216,7 @@ class RestMailingAddress(RestAddress):
         )
 
 
-@dataclass
+@dataclass(**_MODEL_OPTIONS)
 class RestLocation:
     """GPS coordinates attached to a destination."""
 
@@ -169,7 +233,7 @@ class RestLocation:
         )
 
 
-@dataclass
+@dataclass(**_MODEL_OPTIONS)
 class RestDestination:
     """
     A pickup or delivery stop on a transport order.
@@ -203,8 +267,8 @@ class RestDestination:
     departure_time: Optional[str] = None
     delivery_name: str = ""
     signature_url: Union[str, bool, None] = None
-    photos: List[str] = field(default_factory=list)
-    documents: List[str] = field(default_factory=list)
+    photos: Tuple[str, ...] = ()
+    documents: Tuple[str, ...] = ()
     carrier_notes: str = ""
 
     @classmethod
@@ -235,8 +299,8 @@ class RestDestination:
             departure_time=data.get("departureTime"),
             delivery_name=data.get("deliveryName", ""),
             signature_url=data.get("signatureUrl"),
-            photos=data.get("photos") or [],
-            documents=data.get("documents") or [],
+            photos=tuple(data.get("photos") or ()),
+            documents=tuple(data.get("documents") or ()),
             carrier_notes=data.get("carrierNotes", ""),
         )
 
@@ -263,7 +327,7 @@ class RestDestination:
             return None
 
 
-@dataclass
+@dataclass(**_MODEL_OPTIONS)
 class RestGoodsLine:
     """A line of goods (package) on a transport order."""
 
@@ -298,7 +362,7 @@ class RestGoodsLine:
         )
 
 
-@dataclass
+@dataclass(**_MODEL_OPTIONS)
 class RestRate:
     """A sales or purchase rate line attached to an order."""
 
@@ -321,7 +385,7 @@ class RestRate:
         )
 
 
-@dataclass
+@dataclass(**_MODEL_OPTIONS)
 class RestTrackHistoryEntry:
     """A single entry in the Track & Trace history of an order."""
 
@@ -365,7 +429,7 @@ class RestTrackHistoryEntry:
 # Customer models
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(**_MODEL_OPTIONS)
 class RestCustomerContact:
     """A contact person belonging to a customer record."""
 
@@ -398,7 +462,7 @@ class RestCustomerContact:
         )
 
 
-@dataclass
+@dataclass(**_MODEL_OPTIONS)
 class RestCustomer:
     """
     Customer record returned by the REST API.
@@ -435,7 +499,7 @@ class RestCustomer:
     invoice_surcharge: Optional[float] = None
     active: bool = True
     is_deleted: Optional[bool] = None
-    contacts: List[RestCustomerContact] = field(default_factory=list)
+    contacts: Tuple[RestCustomerContact, ...] = ()
     external_id: Optional[str] = None
 
     @classmethod
@@ -444,13 +508,13 @@ class RestCustomer:
         # The REST API may return contacts as a list *or* as a dict keyed by
         # string contact ID (e.g. {"2": {...}}).  Normalise to an iterable of
         # values before passing each item to RestCustomerContact.from_dict().
-        contacts_raw = attrs.get("contacts") or {}
+        contacts_raw = attrs.get("contacts") or ()
         contact_items = contacts_raw.values() if isinstance(contacts_raw, dict) else contacts_raw
-        contacts = [
+        contacts = tuple(
             RestCustomerContact.from_dict(c)
             for c in contact_items
             if isinstance(c, dict)
-        ]
+        )
         return cls(
             id=data.get("id", 0),
             created_at=data.get("createdAt"),
@@ -488,7 +552,7 @@ class RestCustomer:
 # Carrier models
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(**_MODEL_OPTIONS)
 class RestCarrierContact:
     """A contact person belonging to a carrier record."""
 
@@ -513,7 +577,7 @@ class RestCarrierContact:
         )
 
 
-@dataclass
+@dataclass(**_MODEL_OPTIONS)
 class RestCarrier:
     """
     Carrier record returned by the REST API.
@@ -547,24 +611,24 @@ class RestCarrier:
     vat_liable_code: Optional[int] = None
     chamber_of_commerce_no: str = ""
     license_no: str = ""
-    carrier_attributes: List[str] = field(default_factory=list)
+    carrier_attributes: Tuple[str, ...] = ()
     language: str = ""
     active: bool = True
     is_deleted: Optional[bool] = None
-    contacts: List[RestCarrierContact] = field(default_factory=list)
+    contacts: Tuple[RestCarrierContact, ...] = ()
     external_id: Optional[str] = None
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "RestCarrier":
         attrs = data.get("attributes") or data
         # Same dict-keyed-by-string-ID normalisation as RestCustomer.from_dict().
-        contacts_raw = attrs.get("contacts") or {}
+        contacts_raw = attrs.get("contacts") or ()
         contact_items = contacts_raw.values() if isinstance(contacts_raw, dict) else contacts_raw
-        contacts = [
+        contacts = tuple(
             RestCarrierContact.from_dict(c)
             for c in contact_items
             if isinstance(c, dict)
-        ]
+        )
         return cls(
             id=data.get("id", 0),
             created_at=data.get("createdAt"),
@@ -591,7 +655,7 @@ class RestCarrier:
             vat_liable_code=attrs.get("vatLiableCode"),
             chamber_of_commerce_no=attrs.get("chamberOfCommerceNo", ""),
             license_no=attrs.get("licenseNo", ""),
-            carrier_attributes=attrs.get("carrierAttributes") or [],
+            carrier_attributes=tuple(attrs.get("carrierAttributes") or ()),
             language=attrs.get("language", ""),
             active=attrs.get("active", True),
             is_deleted=attrs.get("isDeleted"),
@@ -604,7 +668,7 @@ class RestCarrier:
 # Order models
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(**_MODEL_OPTIONS)
 class RestOrderAttributes:
     """
     All order attributes from the REST API.
@@ -648,16 +712,18 @@ class RestOrderAttributes:
     tracking_id: Optional[str] = None
     external_id: Optional[str] = None
     is_deleted: Optional[bool] = None
-    destinations: List[RestDestination] = field(default_factory=list)
-    goods: List[RestGoodsLine] = field(default_factory=list)
+    destinations: Tuple[RestDestination, ...] = ()
+    goods: Tuple[RestGoodsLine, ...] = ()
     customer: Optional[RestCustomer] = None       # when include_customer=True
     carrier: Optional[RestCarrier] = None         # when include_carrier=True
-    sales_rates: List[RestRate] = field(default_factory=list)
-    purchase_rates: List[RestRate] = field(default_factory=list)
-    track_history: List[RestTrackHistoryEntry] = field(default_factory=list)
+    sales_rates: Tuple[RestRate, ...] = ()
+    purchase_rates: Tuple[RestRate, ...] = ()
+    track_history: Tuple[RestTrackHistoryEntry, ...] = ()
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "RestOrderAttributes":
+    def from_dict(cls, data: Mapping[str, Any]) -> "RestOrderAttributes":
+        customer = data.get("customer")
+        carrier = data.get("carrier")
         return cls(
             order_no=data.get("orderNo", 0),
             date=data.get("date"),
@@ -694,32 +760,19 @@ class RestOrderAttributes:
             tracking_id=data.get("trackingId"),
             external_id=data.get("externalId"),
             is_deleted=data.get("isDeleted"),
-            destinations=[
-                RestDestination.from_dict(d) for d in (data.get("destinations") or [])
-            ],
-            goods=[
-                RestGoodsLine.from_dict(g) for g in (data.get("goods") or [])
-            ],
-            customer=(
-                RestCustomer.from_dict(data["customer"])
-                if data.get("customer")
-                else None
+            destinations=tuple(
+                map(RestDestination.from_dict, data.get("destinations") or ())
             ),
-            carrier=(
-                RestCarrier.from_dict(data["carrier"])
-                if data.get("carrier")
-                else None
+            goods=tuple(map(RestGoodsLine.from_dict, data.get("goods") or ())),
+            customer=RestCustomer.from_dict(customer) if customer else None,
+            carrier=RestCarrier.from_dict(carrier) if carrier else None,
+            sales_rates=tuple(map(RestRate.from_dict, data.get("salesRates") or ())),
+            purchase_rates=tuple(
+                map(RestRate.from_dict, data.get("purchaseRates") or ())
+            ),
+            track_history=tuple(
+                map(RestTrackHistoryEntry.from_dict, data.get("trackHistory") or ())
             ),
-            sales_rates=[
-                RestRate.from_dict(r) for r in (data.get("salesRates") or [])
-            ],
-            purchase_rates=[
-                RestRate.from_dict(r) for r in (data.get("purchaseRates") or [])
-            ],
-            track_history=[
-                RestTrackHistoryEntry.from_dict(t)
-                for t in (data.get("trackHistory") or [])
-            ],
         )
 
     @property
@@ -744,7 +797,7 @@ class RestOrderAttributes:
             return None
 
 
-@dataclass
+@dataclass(**_MODEL_OPTIONS)
 class RestOrder:
     """
     Transport order returned by the REST API.
@@ -766,7 +819,7 @@ class RestOrder:
             id=data.get("id", 0),
             created_at=data.get("createdAt"),
             updated_at=data.get("updatedAt"),
-            attributes=RestOrderAttributes.from_dict(data.get("attributes") or {}),
+            attributes=RestOrderAttributes.from_dict(data.get("attributes") or _EMPTY),
         )
 
 
@@ -774,7 +827,7 @@ class RestOrder:
 # Reference data models
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(**_MODEL_OPTIONS)
 class RestProduct:
     """A transport product (service) available in EasyTrans."""
 
@@ -785,7 +838,7 @@ class RestProduct:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "RestProduct":
-        attrs = data.get("attributes") or {}
+        attrs = data.get("attributes") or _EMPTY
         return cls(
             id=data.get("id", 0),
             product_no=attrs.get("productNo", 0),
@@ -794,7 +847,7 @@ class RestProduct:
         )
 
 
-@dataclass
+@dataclass(**_MODEL_OPTIONS)
 class RestSubstatus:
     """An order substatus (fine-grained status label)."""
 
@@ -805,7 +858,7 @@ class RestSubstatus:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "RestSubstatus":
-        attrs = data.get("attributes") or {}
+        attrs = data.get("attributes") or _EMPTY
         return cls(
             id=data.get("id", 0),
             substatus_no=attrs.get("substatusNo", 0),
@@ -814,7 +867,7 @@ class RestSubstatus:
         )
 
 
-@dataclass
+@dataclass(**_MODEL_OPTIONS)
 class RestPackageType:
     """
     A package / rate type.
@@ -830,7 +883,7 @@ class RestPackageType:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "RestPackageType":
-        attrs = data.get("attributes") or {}
+        attrs = data.get("attributes") or _EMPTY
         return cls(
             id=data.get("id", 0),
             package_type_no=attrs.get("packageTypeNo", 0),
@@ -839,7 +892,7 @@ class RestPackageType:
         )
 
 
-@dataclass
+@dataclass(**_MODEL_OPTIONS)
 class RestVehicleType:
     """A vehicle type (van, truck, etc.) available in EasyTrans."""
 
@@ -850,7 +903,7 @@ class RestVehicleType:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "RestVehicleType":
-        attrs = data.get("attributes") or {}
+        attrs = data.get("attributes") or _EMPTY
         return cls(
             id=data.get("id", 0),
             vehicle_type_no=attrs.get("vehicleTypeNo", 0),
@@ -859,7 +912,7 @@ class RestVehicleType:
         )
 
 
-@dataclass
+@dataclass(**_MODEL_OPTIONS)
 class RestFleetVehicle:
     """
     A vehicle from the branch's own fleet.
@@ -877,7 +930,7 @@ class RestFleetVehicle:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "RestFleetVehicle":
-        attrs = data.get("attributes") or {}
+        attrs = data.get("attributes") or _EMPTY
         return cls(
             id=data.get("id", 0),
             fleet_no=attrs.get("fleetNo", 0),
@@ -893,7 +946,7 @@ class RestFleetVehicle:
 # Invoice model
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(**_MODEL_OPTIONS)
 class RestInvoice:
     """
     A sales invoice returned by the REST API.
@@ -923,6 +976,7 @@ class RestInvoice:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "RestInvoice":
         attrs = data.get("attributes") or data
+        customer = attrs.get("customer")
         return cls(
             id=data.get("id", 0),
             invoice_id=attrs.get("invoiceId", 0),
@@ -940,11 +994,7 @@ class RestInvoice:
             exported=attrs.get("exported"),
             external_id=attrs.get("externalId"),
             invoice_pdf=attrs.get("invoicePdf"),
-            customer=(
-                RestCustomer.from_dict(attrs["customer"])
-                if attrs.get("customer")
-                else None
-            ),
+            customer=RestCustomer.from_dict(customer) if customer else None,
         )
 
 
@@ -23,13 +23,22 @@ EASYTRANS = {
 # services/easytrans_service.py
 # ==========================================
 
+import functools
+
 from django.conf import settings
 from easytrans import EasyTransClient, Order, Destination, Package
 from easytrans.constants import CollectDeliver
 
 
+@functools.lru_cache(maxsize=1)
 def get_easytrans_client():
-    """Factory function to create configured EasyTrans client."""
+    """
+    Return the process-wide EasyTrans client.
+
+    The client is created once per worker process and reused, so its
+    HTTP sessions keep their connections alive across shipments and
+    management commands instead of reconnecting for every call.
+    """
     return EasyTransClient(
         server_url=settings.EASYTRANS["SERVER_URL"],
         environment_name=settings.EASYTRANS["ENVIRONMENT"],
@@ -44,7 +53,9 @@ def create_shipment_from_order(order_model):
     Create shipment in EasyTrans from Django order model.
     
     Args:
-        order_model: Your Django Order model instance
+        order_model: Your Django Order model instance. Fetch it with
+            ``.prefetch_related("items")`` when creating shipments in a
+            loop, so the package lines don't cost one query per order.
     
     Returns:
         OrderResult from EasyTrans
@@ -191,6 +202,7 @@ urlpatterns = [
 # ==========================================
 
 from django.core.management.base import BaseCommand
+from django.db import transaction
 from easytrans import Customer, CustomerContact
 from services.easytrans_service import get_easytrans_client
 from myapp.models import Company
@@ -202,8 +214,16 @@ class Command(BaseCommand):
     def handle(self, *args, **options):
         client = get_easytrans_client()
         
-        # Get all companies that need syncing
-        companies = Company.objects.filter(sync_to_easytrans=True)
+        # Get all companies that need syncing, loading only the columns the
+        # sync reads and all their contacts in one extra query
+        companies = list(
+            Company.objects.filter(sync_to_easytrans=True)
+            .prefetch_related("contacts")
+            .only(
+                "id", "name", "address", "house_number",
+                "postal_code", "city", "country",
+            )
+        )
         
         customers = []
         for company in companies:
@@ -232,10 +252,16 @@ class Command(BaseCommand):
         if customers:
             result = client.import_customers(customers, mode="effect")
             
-            # Update Django models with EasyTrans customer numbers
+            # Update Django models with EasyTrans customer numbers in one
+            # batched UPDATE instead of one save() per company
+            to_update = []
             for idx, customer_no in enumerate(result.new_customernos):
                 companies[idx].easytrans_customer_no = customer_no
-                companies[idx].save()
+                to_update.append(companies[idx])
+            with transaction.atomic():
+                Company.objects.bulk_update(
+                    to_update, ["easytrans_customer_no"], batch_size=500
+                )
             
             self.stdout.write(
                 self.style.SUCCESS(f'Successfully synced {len(customers)} customers')
@@ -7,23 +7,109 @@ Usage:
     python scripts/html_to_intermediate.py
 """
 
+import functools
 import json
 import re
 import sys
 from pathlib import Path
-from bs4 import BeautifulSoup, Tag
+from typing import Callable
+from bs4 import BeautifulSoup, NavigableString, Tag
+
+try:  # optional, faster JSON parsing
+    import orjson
+except ImportError:
+    orjson = None
 
 HTML_FILE = Path("EasyTrans Documentation/easytrans rest api.html")
 OUTPUT_FILE = Path("EasyTrans Documentation/api_intermediate.json")
 
 
+def tag_with_classes(name: str, *classes: str) -> Callable[[Tag], bool]:
+    """
+    Build a BS4 search predicate matching ``<name>`` tags whose class list
+    contains every one of ``classes`` (like the CSS selector ``name.a.b``).
+    """
+    required = frozenset(classes)
+
+    def matches(tag: Tag) -> bool:
+        return tag.name == name and required.issubset(tag.get("class") or ())
+
+    return matches
+
+
+# Stoplight elements, matched by their class lists
+PARAM_NAME = tag_with_classes("div", "sl-font-mono", "sl-font-semibold", "sl-mr-2")
+PARAM_TYPE = tag_with_classes("span", "sl-truncate", "sl-text-muted")
+PARAM_REQUIRED = tag_with_classes("span", "sl-text-warning")
+PARAM_EXAMPLE = tag_with_classes("div", "sl-bg-canvas-tint")
+PARAM_BLOCK = tag_with_classes("div", "sl-flex", "sl-relative", "sl-max-w-full", "sl-py-2")
+MARKDOWN = tag_with_classes("div", "sl-prose", "sl-markdown-viewer")
+TEXT_SM = tag_with_classes("div", "sl-text-sm")
+EXPANDABLE = tag_with_classes("div", "expandable")
+METHOD_BADGE = tag_with_classes("div", "sl-text-lg", "sl-font-semibold", "sl-px-2.5")
+PATH_TITLE = tag_with_classes("div", "sl-flex-1", "sl-font-semibold")
+AUTH_BADGE = tag_with_classes("div", "sl-font-prose", "sl-font-semibold", "sl-px-1.5")
+STACK_5 = tag_with_classes("div", "sl-stack--5")
+STACK_6 = tag_with_classes("div", "sl-stack--6")
+JSON_CODE = tag_with_classes("code", "language-json")
+PANEL = tag_with_classes("div", "sl-panel")
+MAIN_CONTENT = tag_with_classes("div", "sl-overflow-y-auto", "sl-flex-1")
+
+# h3 section title (lower-cased) -> operation key. Scribe emits exactly these
+# titles; SECTION_KEYWORDS is the substring fallback for any variant wording.
+SECTION_BUCKETS = {
+    "headers": "headers",
+    "url parameters": "url_parameters",
+    "query parameters": "query_parameters",
+    "body parameters": "body_parameters",
+    "response fields": "response_fields",
+}
+SECTION_KEYWORDS = (
+    ("headers", "headers"),
+    ("url param", "url_parameters"),
+    ("query param", "query_parameters"),
+    ("body param", "body_parameters"),
+    ("response field", "response_fields"),
+)
+
+WHITESPACE_RE = re.compile(r"\s+")
+
+
+def section_bucket(section_title: str) -> str | None:
+    """Map a lower-cased h3 section title to its operation key, if any."""
+    bucket = SECTION_BUCKETS.get(section_title)
+    if bucket is None:
+        for keyword, key in SECTION_KEYWORDS:
+            if keyword in section_title:
+                return key
+    return bucket
+
+
 def get_text_clean(element) -> str:
     """Extract and clean inner text from a BS4 element."""
     if element is None:
         return ""
     text = element.get_text(separator=" ", strip=True)
+    # get_text(strip=True) already trims the ends; only run the regex when
+    # there is a double space or any other whitespace (tab, newline, nbsp…),
+    # all of which str.isprintable() rejects.
+    if "  " not in text and text.isprintable():
+        return text
     # Collapse multiple whitespace
-    return re.sub(r"\s+", " ", text).strip()
+    return WHITESPACE_RE.sub(" ", text).strip()
+
+
+def leaf_text(element: Tag) -> str:
+    """
+    Stripped text of an element that normally wraps a single string.
+
+    Equivalent to ``element.get_text(strip=True)`` but reads the lone child
+    string directly instead of walking and joining all descendants.
+    """
+    string = element.string
+    if type(string) is NavigableString:  # not a Comment/CData subclass
+        return string.strip()
+    return element.get_text(strip=True)
 
 
 def get_inner_html_clean(element) -> str:
@@ -47,88 +133,95 @@ def parse_param_block(block: Tag) -> dict:
     }
 
     # Name — in sl-font-mono sl-font-semibold sl-mr-2
-    name_div = block.find("div", class_=lambda c: c and "sl-font-mono" in c and "sl-font-semibold" in c and "sl-mr-2" in c)
+    name_div = block.find(PARAM_NAME)
     if name_div:
-        param["name"] = name_div.get_text(strip=True)
+        param["name"] = leaf_text(name_div)
 
-    # Type — in span.sl-truncate.sl-text-muted
-    type_span = block.find("span", class_=lambda c: c and "sl-truncate" in c and "sl-text-muted" in c)
+    # Type — in span.sl-truncate.sl-text-muted (a handful of distinct values
+    # repeated across every parameter, so share one string object per type)
+    type_span = block.find(PARAM_TYPE)
     if type_span:
-        param["type"] = type_span.get_text(strip=True)
+        param["type"] = sys.intern(leaf_text(type_span))
 
     # Required — span with text "required"
-    req_span = block.find("span", class_=lambda c: c and "sl-text-warning" in c)
-    if req_span and "required" in req_span.get_text(strip=True).lower():
+    req_span = block.find(PARAM_REQUIRED)
+    if req_span and "required" in leaf_text(req_span).lower():
         param["required"] = True
 
     # Description — in div.sl-prose.sl-markdown-viewer
-    desc_div = block.find("div", class_=lambda c: c and "sl-prose" in c and "sl-markdown-viewer" in c)
+    desc_div = block.find(MARKDOWN)
     if desc_div:
         param["description"] = get_text_clean(desc_div)
 
     # Example value — in div.sl-bg-canvas-tint
-    example_div = block.find("div", class_=lambda c: c and "sl-bg-canvas-tint" in c)
+    example_div = block.find(PARAM_EXAMPLE)
     if example_div:
-        param["example"] = example_div.get_text(strip=True)
+        param["example"] = leaf_text(example_div)
 
     return param
 
 
+def find_param_blocks(container: Tag) -> list[Tag]:
+    """
+    Return the parameter blocks directly inside a div.sl-text-sm container.
+    """
+    # Top-level sl-flex sl-relative sl-max-w-full blocks
+    param_blocks = container.find_all(PARAM_BLOCK, recursive=False)
+    if param_blocks:
+        return param_blocks
+    # If not found at top level, search one level deeper (expandable wrappers)
+    return [
+        pb
+        for exp in container.find_all(EXPANDABLE, recursive=False)
+        if (pb := exp.find(PARAM_BLOCK))
+    ]
+
+
 def parse_param_section(section_div: Tag) -> list[dict]:
     """
     Within a parameter section (Headers/URL Parameters/Query Parameters/Body Parameters/Response Fields),
     find all parameter blocks and parse each one.
     """
-    params = []
     # Each parameter is inside a div.sl-flex.sl-relative or similar structure
     # The outer wrapper is often div.sl-text-sm containing the actual param rows
-    text_sm_divs = section_div.find_all("div", class_=lambda c: c and "sl-text-sm" in c, recursive=False)
-
-    for container in text_sm_divs:
-        # Find all top-level sl-flex sl-relative sl-max-w-full blocks
-        param_blocks = container.find_all(
-            "div",
-            class_=lambda c: c and "sl-flex" in c and "sl-relative" in c and "sl-max-w-full" in c and "sl-py-2" in c,
-            recursive=False,
-        )
-        # If not found at top level, search one level deeper (expandable wrappers)
-        if not param_blocks:
-            expandables = container.find_all("div", class_=lambda c: c and "expandable" in c, recursive=False)
-            for exp in expandables:
-                pb = exp.find(
-                    "div",
-                    class_=lambda c: c and "sl-flex" in c and "sl-relative" in c and "sl-max-w-full" in c and "sl-py-2" in c,
-                )
-                if pb:
-                    param_blocks.append(pb)
-
-        for block in param_blocks:
-            p = parse_param_block(block)
-            if p["name"]:
-                params.append(p)
+    params = [
+        p
+        for container in section_div.find_all(TEXT_SM, recursive=False)
+        for block in find_param_blocks(container)
+        if (p := parse_param_block(block))["name"]
+    ]
 
     # Also handle response field expandable wrappers at the same level
     if not params:
-        expandables = section_div.find_all("div", class_=lambda c: c and "expandable" in c)
-        for exp in expandables:
-            pb = exp.find(
-                "div",
-                class_=lambda c: c and "sl-flex" in c and "sl-relative" in c and "sl-max-w-full" in c and "sl-py-2" in c,
-            )
-            if pb:
-                p = parse_param_block(pb)
-                if p["name"]:
-                    params.append(p)
+        params = [
+            p
+            for exp in section_div.find_all(EXPANDABLE)
+            if (pb := exp.find(PARAM_BLOCK))
+            if (p := parse_param_block(pb))["name"]
+        ]
 
     return params
 
 
+@functools.lru_cache(maxsize=512)
+def load_json_cached(raw: str) -> dict | list:
+    """
+    Parse a JSON document, memoised on its raw text.
+
+    The docs repeat identical response bodies (e.g. error envelopes) across
+    endpoints; repeats return the same object, so callers must not mutate it.
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 def parse_json_example(code_elem: Tag) -> dict | list | None:
     """Extract and parse JSON from a <code class='language-json'> element."""
     raw = code_elem.get_text()
     try:
-        return json.loads(raw)
-    except json.JSONDecodeError:
+        return load_json_cached(raw)
+    except ValueError:  # json.JSONDecodeError / orjson.JSONDecodeError
         return None
 
 
@@ -158,40 +251,32 @@ def parse_operation(op_div: Tag, current_tag: str) -> dict:
 
     # ----- Method & Path -----
     # Method div has style="background-color: green;" or darkblue etc.
-    method_div = op_div.find(
-        "div",
-        class_=lambda c: c and "sl-text-lg" in c and "sl-font-semibold" in c and "sl-px-2.5" in c,
-    )
+    method_div = op_div.find(METHOD_BADGE)
     if method_div:
-        operation["method"] = method_div.get_text(strip=True).upper()
+        operation["method"] = sys.intern(method_div.get_text(strip=True).upper())
 
     # Path is in the flex-1 font-semibold sibling
-    path_div = op_div.find("div", class_=lambda c: c and "sl-flex-1" in c and "sl-font-semibold" in c)
+    path_div = op_div.find(PATH_TITLE)
     if path_div:
         operation["path"] = path_div.get_text(strip=True)
 
     # Auth required
-    auth_badge = op_div.find(
-        "div",
-        class_=lambda c: c and "sl-font-prose" in c and "sl-font-semibold" in c and "sl-px-1.5" in c,
-    )
+    auth_badge = op_div.find(AUTH_BADGE)
     if auth_badge and "requires authentication" in auth_badge.get_text(strip=True).lower():
         operation["auth_required"] = True
 
     # ----- Description paragraph(s) -----
     # These are <p> tags directly inside the first sl-stack--5 div (before the two-column layout)
-    top_section = op_div.find("div", class_=lambda c: c and "sl-stack--5" in c)
+    top_section = op_div.find(STACK_5)
     if top_section:
-        desc_parts = []
-        for p in top_section.find_all("p", recursive=False):
-            desc_parts.append(get_text_clean(p))
+        desc_parts = [get_text_clean(p) for p in top_section.find_all("p", recursive=False)]
         if not desc_parts:
-            # Try at the op_div level
-            for p in op_div.find_all("p", limit=5):
-                txt = get_text_clean(p)
-                if txt and txt not in desc_parts:
-                    desc_parts.append(txt)
-                    break
+            # Try at the op_div level: first non-empty paragraph of the first five
+            fallback = next(
+                filter(None, map(get_text_clean, op_div.find_all("p", limit=5))), ""
+            )
+            if fallback:
+                desc_parts.append(fallback)
         operation["description"] = " ".join(desc_parts)
 
     # ----- Left column: parameters & response fields -----
@@ -201,36 +286,25 @@ def parse_operation(op_div: Tag, current_tag: str) -> dict:
         for h3 in left_col.find_all("h3"):
             section_title = h3.get_text(strip=True).lower()
             # The parameter content follows in the sibling div
-            section_container = h3.find_parent(
-                "div", class_=lambda c: c and "sl-stack--6" in c
-            ) or h3.find_parent(
-                "div", class_=lambda c: c and "sl-stack--5" in c
-            )
+            section_container = h3.find_parent(STACK_6) or h3.find_parent(STACK_5)
             if not section_container:
                 continue
 
             params = parse_param_section(section_container)
 
-            if "headers" in section_title:
-                operation["headers"] = params
-            elif "url parameters" in section_title or "url param" in section_title:
-                operation["url_parameters"] = params
-            elif "query parameters" in section_title or "query param" in section_title:
-                operation["query_parameters"] = params
-            elif "body parameters" in section_title or "body param" in section_title:
-                operation["body_parameters"] = params
-            elif "response fields" in section_title or "response field" in section_title:
-                operation["response_fields"] = params
+            bucket = section_bucket(section_title)
+            if bucket:
+                operation[bucket] = params
 
     # ----- Right column: response examples -----
     right_col = op_div.find("div", attrs={"data-testid": "two-column-right"})
     if right_col:
-        for code_elem in right_col.find_all("code", class_=lambda c: c and "language-json" in c):
+        for code_elem in right_col.find_all(JSON_CODE):
             parsed = parse_json_example(code_elem)
             if parsed is not None:
                 # Try to find the associated HTTP status from the select option
                 status = "200"
-                panel = code_elem.find_parent("div", class_=lambda c: c and "sl-panel" in c)
+                panel = code_elem.find_parent(PANEL)
                 if panel:
                     select = panel.find("select")
                     if select:
@@ -249,8 +323,10 @@ def parse_html(html_path: Path) -> dict:
       - endpoints: list of parsed operations
     """
     print(f"Reading {html_path} …")
-    with open(html_path, "r", encoding="utf-8") as fh:
-        soup = BeautifulSoup(fh, "lxml")
+    # Hand lxml the raw bytes: it decodes UTF-8 in C, which skips building a
+    # multi-megabyte Python str for the whole page first.
+    with open(html_path, "rb") as fh:
+        soup = BeautifulSoup(fh, "lxml", from_encoding="utf-8")
 
     result = {
         "info": {
@@ -270,7 +346,7 @@ def parse_html(html_path: Path) -> dict:
             result["info"]["base_url"] = code.get_text(strip=True)
 
     # Extract intro description
-    intro_section = soup.find("div", class_=lambda c: c and "sl-prose" in c and "sl-markdown-viewer" in c)
+    intro_section = soup.find(MARKDOWN)
     if intro_section:
         intro_h1 = intro_section.find("h1", id="introduction")
         if intro_h1:
@@ -284,16 +360,15 @@ def parse_html(html_path: Path) -> dict:
             result["info"]["description"] = " ".join(desc_parts)
 
     # Walk through the main content, tracking the current section tag (h1 headings)
-    main_content = soup.find("div", class_=lambda c: c and "sl-overflow-y-auto" in c and "sl-flex-1" in c)
+    main_content = soup.find(MAIN_CONTENT)
     if not main_content:
         # Fallback: entire body
         main_content = soup.body
 
+    # Only section headings and operations matter; select() returns both in
+    # document order without visiting every text node in the page.
     current_tag = "General"
-    for elem in main_content.descendants:
-        if not isinstance(elem, Tag):
-            continue
-
+    for elem in main_content.select("h1[id], .HttpOperation"):
         # Track h1 section headings (the resource groups)
         if elem.name == "h1" and elem.get("id") and elem.get("id") not in ("introduction", "authenticating-requests"):
             current_tag = elem.get_text(strip=True)
@@ -316,8 +391,12 @@ def main():
     data = parse_html(HTML_FILE)
 
     OUTPUT_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(OUTPUT_FILE, "w", encoding="utf-8") as fh:
-        json.dump(data, fh, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        # Same bytes as the json.dump() fallback: 2-space indent, raw UTF-8
+        OUTPUT_FILE.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(OUTPUT_FILE, "w", encoding="utf-8") as fh:
+            json.dump(data, fh, indent=2, ensure_ascii=False)
 
     print(f"Intermediate JSON written to {OUTPUT_FILE}")
 
@@ -6,14 +6,24 @@ Usage:
     python scripts/intermediate_to_openapi.py
 """
 
+import functools
 import json
 import re
 import sys
 from pathlib import Path
-from collections import OrderedDict
 
 import yaml
 
+try:  # optional, faster JSON parsing
+    import orjson
+except ImportError:
+    orjson = None
+
+try:  # libyaml-backed emitter; same output, several times faster
+    from yaml import CSafeDumper as _BaseDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _BaseDumper
+
 INTERMEDIATE_FILE = Path("EasyTrans Documentation/api_intermediate.json")
 OUTPUT_FILE = Path("EasyTrans Documentation/openapi.yaml")
 
@@ -22,7 +32,7 @@ OUTPUT_FILE = Path("EasyTrans Documentation/openapi.yaml")
 # YAML helpers — preserve key insertion order and produce clean output
 # ---------------------------------------------------------------------------
 
-class _OrderedDumper(yaml.Dumper):
+class _OrderedDumper(_BaseDumper):
     pass
 
 
@@ -31,12 +41,16 @@ def _dict_representer(dumper, data):
 
 
 _OrderedDumper.add_representer(dict, _dict_representer)
-_OrderedDumper.add_representer(OrderedDict, _dict_representer)
 
 
-def dump_yaml(data) -> str:
+def dump_yaml(data, stream=None) -> str | None:
+    """
+    Serialise ``data`` as YAML. Returns the text, or writes it to ``stream``
+    (and returns None) when one is given.
+    """
     return yaml.dump(
         data,
+        stream,
         Dumper=_OrderedDumper,
         default_flow_style=False,
         allow_unicode=True,
@@ -50,24 +64,31 @@ def dump_yaml(data) -> str:
 # Schema inference from JSON example values
 # ---------------------------------------------------------------------------
 
+# Classifies example strings in one match; the group name is the OpenAPI format
+_STRING_FORMAT_RE = re.compile(
+    r"(?P<date_time>\d{4}-\d{2}-\d{2}T)"
+    r"|(?P<date>\d{4}-\d{2}-\d{2}$)"
+    r"|(?P<time>\d{2}:\d{2}(?::\d{2})?$)"
+)
+_STRING_FORMATS = {"date_time": "date-time", "date": "date", "time": "time"}
+
+
 def infer_schema(value, name: str = "") -> dict:
     """Recursively infer an OpenAPI schema from a Python value."""
     if value is None:
         return {"nullable": True, "type": "string"}  # OpenAPI 3.0 compat null
-    if isinstance(value, bool):
+    if value is True or value is False:  # before int: bool subclasses int
         return {"type": "boolean"}
     if isinstance(value, int):
         return {"type": "integer"}
     if isinstance(value, float):
         return {"type": "number", "format": "float"}
     if isinstance(value, str):
-        # Detect common formats
-        if re.match(r"^\d{4}-\d{2}-\d{2}T", value):
-            return {"type": "string", "format": "date-time", "example": value}
-        if re.match(r"^\d{4}-\d{2}-\d{2}$", value):
-            return {"type": "string", "format": "date", "example": value}
-        if re.match(r"^\d{2}:\d{2}(:\d{2})?$", value):
-            return {"type": "string", "format": "time", "example": value}
+        # Detect common formats (all of them start with a digit, which most
+        # names, notes and e-mail addresses don't)
+        m = _STRING_FORMAT_RE.match(value) if value[:1].isdigit() else None
+        if m:
+            return {"type": "string", "format": _STRING_FORMATS[m.lastgroup], "example": value}
         return {"type": "string", "example": value}
     if isinstance(value, list):
         if not value:
@@ -963,6 +984,11 @@ STANDARD_ERROR_RESPONSES = {
     },
 }
 
+# Only PUT endpoints can fail validation; everything else gets 401/404/429
+_ERROR_RESPONSES_NO_422 = {
+    code: response for code, response in STANDARD_ERROR_RESPONSES.items() if code != "422"
+}
+
 
 # ---------------------------------------------------------------------------
 # Map endpoint paths/methods to known response schema refs
@@ -998,11 +1024,15 @@ RESPONSE_SCHEMA_MAP = {
 # Tag name cleanup
 # ---------------------------------------------------------------------------
 
+_TAG_QUALIFIER_RE = re.compile(r"\s*\(.*")
+
+
+@functools.lru_cache(maxsize=None)
 def clean_tag(tag: str) -> str:
     # Strip the parenthetical account type qualifier for clean tag names.
     # e.g. "Orders (Customer or branch account)" -> "Orders"
     #      "Orders for carrier (Carrier account)" -> "Orders for carrier"
-    cleaned = re.sub(r"\s*\(.*", "", tag).strip()
+    cleaned = _TAG_QUALIFIER_RE.sub("", tag).strip()
     return cleaned if cleaned else tag.strip()
 
 
@@ -1010,11 +1040,14 @@ def clean_tag(tag: str) -> str:
 # Operation ID generation
 # ---------------------------------------------------------------------------
 
+_METHOD_VERBS = {"GET": "get", "PUT": "update", "POST": "create", "DELETE": "delete", "PATCH": "patch"}
+_DROP_BRACES = str.maketrans("", "", "{}")
+
+
 def make_operation_id(method: str, path: str) -> str:
     # e.g. GET /v1/orders/{orderNo} -> getOrderByOrderNo
-    method_map = {"GET": "get", "PUT": "update", "POST": "create", "DELETE": "delete", "PATCH": "patch"}
-    verb = method_map.get(method, method.lower())
-    parts = path.replace("/v1/", "").replace("{", "").replace("}", "").split("/")
+    verb = _METHOD_VERBS.get(method, method.lower())
+    parts = path.replace("/v1/", "").translate(_DROP_BRACES).split("/")
     name = "".join(p.capitalize() for p in parts if p)
     return f"{verb}{name}"
 
@@ -1088,7 +1121,9 @@ def build_operation(ep: dict) -> dict:
         if p["name"] == "filter":
             continue
         # Convert filter.xxx notation → filter[xxx] query param style
-        name = p["name"].replace(".", "[") + ("" if "." not in p["name"] else "]")
+        name = p["name"]
+        if "." in name:
+            name = name.replace(".", "[") + "]"
         param = {
             "name": name,
             "in": "query",
@@ -1098,6 +1133,11 @@ def build_operation(ep: dict) -> dict:
         }
         op["parameters"].append(param)
 
+    # An absent "parameters" means none. Keep "security" even when empty,
+    # though: [] there overrides the global basicAuth for public endpoints.
+    if not op["parameters"]:
+        del op["parameters"]
+
     # Body parameters (for PUT requests)
     if ep.get("body_parameters"):
         body_props = {}
@@ -1143,12 +1183,10 @@ def build_operation(ep: dict) -> dict:
 
     op["responses"]["200"] = success_response
 
-    # Add standard error responses
-    op["responses"].update(STANDARD_ERROR_RESPONSES)
-
-    # PUT endpoints additionally get 422
-    if method != "PUT":
-        op["responses"].pop("422", None)
+    # Add standard error responses; PUT endpoints additionally get 422
+    op["responses"].update(
+        STANDARD_ERROR_RESPONSES if method == "PUT" else _ERROR_RESPONSES_NO_422
+    )
 
     return op
 
@@ -1225,21 +1263,14 @@ def build_openapi(data: dict) -> dict:
     }
 
     # Collect unique (ordered) tags
-    seen_tags = []
-    for ep in data["endpoints"]:
-        t = clean_tag(ep["tag"])
-        if t not in seen_tags:
-            seen_tags.append(t)
+    seen_tags = dict.fromkeys(clean_tag(ep["tag"]) for ep in data["endpoints"])
 
     spec["tags"] = [{"name": t} for t in seen_tags]
 
     # Build paths
     for ep in data["endpoints"]:
-        path = ep["path"]
-        method = ep["method"].lower()
-        if path not in spec["paths"]:
-            spec["paths"][path] = {}
-        spec["paths"][path][method] = build_operation(ep)
+        path_item = spec["paths"].setdefault(ep["path"], {})
+        path_item[ep["method"].lower()] = build_operation(ep)
 
     return spec
 
@@ -1254,8 +1285,11 @@ def main():
         sys.exit(1)
 
     print(f"Reading {INTERMEDIATE_FILE} …")
-    with open(INTERMEDIATE_FILE, "r", encoding="utf-8") as fh:
-        data = json.load(fh)
+    if orjson is not None:
+        data = orjson.loads(INTERMEDIATE_FILE.read_bytes())
+    else:
+        with open(INTERMEDIATE_FILE, "r", encoding="utf-8") as fh:
+            data = json.load(fh)
 
     print("Building OpenAPI spec …")
     spec = build_openapi(data)
@@ -1267,7 +1301,7 @@ def main():
 
     OUTPUT_FILE.parent.mkdir(parents=True, exist_ok=True)
     with open(OUTPUT_FILE, "w", encoding="utf-8") as fh:
-        fh.write(dump_yaml(spec))
+        dump_yaml(spec, fh)  # stream straight to disk, no intermediate str
 
     print(f"OpenAPI spec written to {OUTPUT_FILE}")
 
@@ -5,6 +5,8 @@ Provides reusable fixtures for client instances, sample data,
 and mock API responses.
 """
 
+from __future__ import annotations
+
 import json
 import pytest
 from typing import Dict, Any
@@ -29,9 +31,9 @@ def client():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_destinations():
-    """Create sample pickup and delivery destinations."""
+    """Create sample pickup and delivery destinations (shared; do not mutate)."""
     return [
         Destination(
             destinationno=1,
@@ -64,9 +66,9 @@ def sample_destinations():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_packages():
-    """Create sample package/goods data."""
+    """Create sample package/goods data (shared; do not mutate)."""
     return [
         Package(
             amount=2.0,
@@ -79,12 +81,14 @@ def sample_packages():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_order(sample_destinations, sample_packages):
     """
     Create a complete sample order for testing.
     
-    Includes destinations and packages.
+    Includes destinations and packages. The sample model fixtures are
+    session-scoped and shared between tests, so treat them as read-only
+    (use ``dataclasses.replace`` for a variant).
     """
     return Order(
         productno=2,
@@ -101,9 +105,9 @@ def sample_order(sample_destinations, sample_packages):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_customer_contacts():
-    """Create sample customer contacts."""
+    """Create sample customer contacts (shared; do not mutate)."""
     return [
         CustomerContact(
             salutation=Salutation.MR.value,
@@ -120,9 +124,9 @@ def sample_customer_contacts():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_customer(sample_customer_contacts):
-    """Create a complete sample customer for testing."""
+    """Create a complete sample customer for testing (shared; do not mutate)."""
     return Customer(
         company_name="Example Company A",
         attn="Administration",
@@ -17,6 +17,8 @@ their required ID is absent.
 """
 
 import os
+import pathlib
+import time
 import pytest
 
 from easytrans import EasyTransClient, Order, Destination, Package, Customer, CustomerContact
@@ -27,6 +29,7 @@ from easytrans.constants import CollectDeliver, Salutation
 # ---------------------------------------------------------------------------
 
 _CREDENTIALS_PRESENT = bool(os.getenv("EASYTRANS_USERNAME"))
+_INTEGRATION_DIR = pathlib.Path(__file__).parent
 
 _SKIP_REASON = (
     "Integration credentials not configured. "
@@ -37,11 +40,12 @@ _SKIP_REASON = (
 
 def pytest_collection_modifyitems(items):
     """Skip all integration tests when credentials are absent."""
-    if not _CREDENTIALS_PRESENT:
-        skip_marker = pytest.mark.skip(reason=_SKIP_REASON)
-        for item in items:
-            if "integration" in str(item.fspath):
-                item.add_marker(skip_marker)
+    if _CREDENTIALS_PRESENT:
+        return
+    skip_marker = pytest.mark.skip(reason=_SKIP_REASON)
+    for item in items:
+        if _INTEGRATION_DIR in item.path.parents:
+            item.add_marker(skip_marker)
 
 
 # ---------------------------------------------------------------------------
@@ -110,13 +114,14 @@ def real_client():
 # Shared destination fixtures
 # ---------------------------------------------------------------------------
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def minimal_destinations():
     """
     Minimal destination pair — only the fields present in the
     'minimal' example from the official documentation.
 
     Notably absent: country, collect_deliver, telephone, contact.
+    Shared across the session; do not mutate.
     """
     return [
         Destination(
@@ -136,9 +141,9 @@ def minimal_destinations():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def simple_destinations():
-    """Full destination pair with explicit collect_deliver values."""
+    """Full destination pair with explicit collect_deliver values (shared; do not mutate)."""
     return [
         Destination(
             collect_deliver=CollectDeliver.PICKUP.value,
@@ -170,13 +175,14 @@ def simple_destinations():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def extended_destinations():
     """
     Three-stop destination list from the 'extended' documentation example.
 
     Destination 2 uses collect_deliver=2 (BOTH), which exercises the third
     enum value not covered by the unit test fixtures.
+    Shared across the session; do not mutate.
     """
     return [
         Destination(
@@ -237,9 +243,9 @@ def extended_destinations():
 # Shared package fixtures
 # ---------------------------------------------------------------------------
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def standard_packages():
-    """Single package line with full dimensions (used by most tests)."""
+    """Single package line with full dimensions, used by most tests (shared; do not mutate)."""
     return [
         Package(
             amount=2.0,
@@ -252,11 +258,12 @@ def standard_packages():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def routed_packages():
     """
     Package lines with explicit collect_destinationno/deliver_destinationno
-    routing (from the 'extended' documentation example).
+    routing (from the 'extended' documentation example). Shared across
+    the session; do not mutate.
     """
     return [
         Package(
@@ -287,9 +294,9 @@ def routed_packages():
 # Shared customer fixtures
 # ---------------------------------------------------------------------------
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def simple_customer_contact():
-    """Single contact without portal access credentials."""
+    """Single contact without portal access credentials (shared; do not mutate)."""
     return CustomerContact(
         salutation=Salutation.MR.value,
         contact_name="Bram Pietersen",
@@ -302,9 +309,9 @@ def simple_customer_contact():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def portal_contacts():
-    """Two contacts with portal access credentials (from extended example)."""
+    """Two contacts with portal access (extended example; shared, do not mutate)."""
     return [
         CustomerContact(
             salutation=Salutation.MR.value,
@@ -336,23 +343,16 @@ def portal_contacts():
 # ---------------------------------------------------------------------------
 
 @pytest.fixture(scope="session")
-def rest_client():
+def rest_client(real_client):
     """
     Return an EasyTransClient for REST API integration tests.
 
-    Reuses the same credentials as the JSON import tests. The client is
-    session-scoped so the same TCP connection pool is reused across all
-    REST tests.
+    This is the same session-scoped instance as ``real_client``: the REST
+    calls use the same host and credentials, and ``default_mode`` only
+    affects JSON import calls, so a second client would just be another
+    set of connection pools to open and close.
     """
-    client = EasyTransClient(
-        server_url=os.environ.get("EASYTRANS_SERVER", "mytrans.nl"),
-        environment_name=os.environ.get("EASYTRANS_ENV", "demo"),
-        username=os.environ["EASYTRANS_USERNAME"],
-        password=os.environ["EASYTRANS_PASSWORD"],
-        timeout=30,
-    )
-    yield client
-    client.close()
+    return real_client
 
 
 def _rest_entity_fixture(env_var: str, label: str, cast=int):
@@ -410,14 +410,37 @@ rest_known_invoice_id = _rest_entity_fixture(
 # Rate-limit guard
 # ---------------------------------------------------------------------------
 
+# Minimum gap between the end of one network test and the start of the next.
+# Under pytest-xdist every worker runs its own guard, so the per-worker
+# interval is stretched by the worker count to keep the combined rate the same.
+_MIN_TEST_INTERVAL = 1.1 * int(os.getenv("PYTEST_XDIST_WORKER_COUNT", "1"))
+_last_test_end = 0.0
+
+
 @pytest.fixture(autouse=True)
-def _rate_limit_guard():
+def _rate_limit_guard(request):
     """
-    Pause briefly before every integration test to avoid hitting the
-    EasyTrans rate limit of 60 requests per minute.
-
-    At 1.1 s per test the full REST suite (~65 tests) takes ~70 s — still
-    well within a CI timeout — while ensuring we never exceed 54 req/min.
+    Space integration tests out to avoid hitting the EasyTrans rate limit
+    of 60 requests per minute.
+
+    The interval counts from the end of the previous network test (its
+    teardown), so its last API call is always at least 1.1 s before the
+    next test's first one and we never exceed 54 req/min across tests.
+    Only the remainder of the interval is slept, so time already spent in
+    collection or fixture setup is not paid twice. Calls made within a
+    single test are not spaced out.
+    With ``pytest -n N`` each worker waits N × 1.1 s between its own tests,
+    so the suite stays at the same overall rate while slow round-trips on
+    different workers overlap.
+    Tests without the ``network`` marker never touch the API and are not
+    throttled.
     """
-    import time
-    time.sleep(1.1)
+    global _last_test_end
+    if request.node.get_closest_marker("network") is None:
+        yield
+        return
+    wait = _MIN_TEST_INTERVAL - (time.monotonic() - _last_test_end)
+    if wait > 0:
+        time.sleep(wait)
+    yield
+    _last_test_end = time.monotonic()
@@ -25,7 +25,7 @@ from easytrans import Customer
 from easytrans.constants import PaymentMethod, Language, VatLiable
 from easytrans.models import CustomerResult
 
-pytestmark = pytest.mark.integration
+pytestmark = [pytest.mark.integration, pytest.mark.network]
 
 
 class TestExtendedCustomerImport:
@@ -127,18 +127,18 @@ class TestExtendedCustomerImport:
 
         assert result.total_customers == 1
 
-    def test_language_field_accepted(self, real_client, simple_customer_contact):
+    @pytest.mark.parametrize("lang", [Language.DUTCH.value, Language.ENGLISH.value])
+    def test_language_field_accepted(self, real_client, simple_customer_contact, lang):
         """language='nl' and language='en' are both accepted without errors."""
-        for lang in (Language.DUTCH.value, Language.ENGLISH.value):
-            customer = Customer(
-                company_name="Language Test Company",
-                language=lang,
-                customer_contacts=[simple_customer_contact],
-            )
+        customer = Customer(
+            company_name="Language Test Company",
+            language=lang,
+            customer_contacts=[simple_customer_contact],
+        )
 
-            result = real_client.import_customers([customer], mode="test")
+        result = real_client.import_customers([customer], mode="test")
 
-            assert result.total_customers == 1
+        assert result.total_customers == 1
 
     def test_crm_notes_and_eorino_accepted(self, real_client, simple_customer_contact):
         """crm_notes and eorino are accepted without causing a validation error."""
@@ -25,7 +25,7 @@ import pytest
 from easytrans import Customer
 from easytrans.models import CustomerResult
 
-pytestmark = pytest.mark.integration
+pytestmark = [pytest.mark.integration, pytest.mark.network]
 
 
 class TestSimpleCustomerImport:
@@ -35,7 +35,7 @@ from easytrans import Customer
 from easytrans.models import CustomerResult
 from easytrans.exceptions import EasyTransCustomerError
 
-pytestmark = pytest.mark.integration
+pytestmark = [pytest.mark.integration, pytest.mark.network]
 
 
 class TestCustomerUpdate:
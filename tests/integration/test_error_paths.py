@@ -27,7 +27,7 @@ from easytrans.exceptions import (
     EasyTransCustomerError,
 )
 
-pytestmark = pytest.mark.integration
+pytestmark = [pytest.mark.integration, pytest.mark.network]
 
 
 # ---------------------------------------------------------------------------
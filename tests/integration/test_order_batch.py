@@ -21,7 +21,7 @@ import pytest
 from easytrans import Order
 from easytrans.models import OrderResult
 
-pytestmark = pytest.mark.integration
+pytestmark = [pytest.mark.integration, pytest.mark.network]
 
 
 class TestBatchOrderImport:
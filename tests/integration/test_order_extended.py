@@ -29,7 +29,7 @@ import pytest
 from easytrans import Order
 from easytrans.models import OrderResult, OrderRate
 
-pytestmark = pytest.mark.integration
+pytestmark = [pytest.mark.integration, pytest.mark.network]
 
 
 class TestExtendedOrderImport:
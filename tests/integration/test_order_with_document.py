@@ -24,7 +24,7 @@ from easytrans import Order, Destination
 from easytrans.models import Document
 from easytrans.constants import CollectDeliver, DocumentType
 
-pytestmark = pytest.mark.integration
+pytestmark = [pytest.mark.integration, pytest.mark.network]
 
 # Minimal valid PDF encoded as base64 (3×3 pt blank page, ~500 bytes).
 _MINIMAL_PDF_BASE64 = (
@@ -37,7 +37,7 @@ from easytrans.rest_models import (
 )
 
 
-pytestmark = pytest.mark.integration
+pytestmark = [pytest.mark.integration, pytest.mark.network]
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -65,10 +65,10 @@ class TestGetCustomers:
         for customer in result.data:
             assert isinstance(customer.company_name, str)
 
-    def test_contacts_is_list(self, rest_client):
+    def test_contacts_is_tuple(self, rest_client):
         result = rest_client.get_customers()
         for customer in result.data:
-            assert isinstance(customer.contacts, list)
+            assert isinstance(customer.contacts, tuple)
 
     def test_filter_by_company_name(self, rest_client):
         """Filtering by company name returns a subset."""
@@ -132,10 +132,10 @@ class TestGetCarriers:
         for carrier in result.data:
             assert carrier.carrier_no > 0
 
-    def test_carrier_attributes_is_list(self, rest_client):
+    def test_carrier_attributes_is_tuple(self, rest_client):
         result = rest_client.get_carriers()
         for carrier in result.data:
-            assert isinstance(carrier.carrier_attributes, list)
+            assert isinstance(carrier.carrier_attributes, tuple)
 
     def test_not_found_raises(self, rest_client):
         with pytest.raises(EasyTransNotFoundError):
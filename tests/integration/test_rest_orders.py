@@ -21,7 +21,7 @@ from easytrans.exceptions import EasyTransNotFoundError
 from easytrans.rest_models import PagedResponse, RestOrder, RestDestination, RestGoodsLine
 
 
-pytestmark = pytest.mark.integration
+pytestmark = [pytest.mark.integration, pytest.mark.network]
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -81,16 +81,16 @@ class TestGetOrders:
             if order.attributes.customer is not None:
                 assert order.attributes.customer.customer_no > 0
 
-    def test_include_track_history_embeds_list(self, rest_client):
+    def test_include_track_history_embeds_tuple(self, rest_client):
         """include_track_history=True embeds an array (possibly empty)."""
         result = rest_client.get_orders(include_track_history=True)
         for order in result.data:
-            assert isinstance(order.attributes.track_history, list)
+            assert isinstance(order.attributes.track_history, tuple)
 
-    def test_include_sales_rates_embeds_list(self, rest_client):
+    def test_include_sales_rates_embeds_tuple(self, rest_client):
         result = rest_client.get_orders(include_sales_rates=True)
         for order in result.data:
-            assert isinstance(order.attributes.sales_rates, list)
+            assert isinstance(order.attributes.sales_rates, tuple)
 
     def test_destinations_are_rest_destination(self, rest_client):
         """Each destination inside an order is a RestDestination."""
@@ -137,11 +137,11 @@ class TestGetOrder:
 
     def test_with_track_history(self, rest_client, rest_known_order_no):
         order = rest_client.get_order(rest_known_order_no, include_track_history=True)
-        assert isinstance(order.attributes.track_history, list)
+        assert isinstance(order.attributes.track_history, tuple)
 
     def test_with_sales_rates(self, rest_client, rest_known_order_no):
         order = rest_client.get_order(rest_known_order_no, include_sales_rates=True)
-        assert isinstance(order.attributes.sales_rates, list)
+        assert isinstance(order.attributes.sales_rates, tuple)
 
     def test_with_customer_embedded(self, rest_client, rest_known_order_no):
         order = rest_client.get_order(rest_known_order_no, include_customer=True)
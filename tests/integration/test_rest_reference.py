@@ -33,7 +33,7 @@ from easytrans.rest_models import (
 )
 
 
-pytestmark = pytest.mark.integration
+pytestmark = [pytest.mark.integration, pytest.mark.network]
 
 
 # ─────────────────────────────────────────────────────────────────────────────
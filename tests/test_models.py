@@ -4,6 +4,8 @@ Unit tests for data models.
 Tests serialization, deserialization, and validation of all dataclass models.
 """
 
+import sys
+
 import pytest
 from easytrans.models import (
     Order,
@@ -144,6 +146,14 @@ class TestOrder:
         assert len(order.order_destinations) == 2
         assert len(order.order_packages) == 1
 
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10+")
+    def test_request_models_use_slots(self, sample_destinations, sample_packages):
+        """Test request models are slotted on Python 3.10+."""
+        order = Order(productno=1, order_destinations=sample_destinations, order_packages=sample_packages)
+        assert not hasattr(order, "__dict__")
+        assert not hasattr(order.order_destinations[0], "__dict__")
+        assert not hasattr(order.order_packages[0], "__dict__")
+
 
 class TestCustomer:
     """Test Customer model."""
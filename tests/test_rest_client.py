@@ -19,6 +19,7 @@ from responses import RequestsMock
 
 from easytrans import EasyTransClient
 from easytrans.exceptions import (
+    EasyTransAPIError,
     EasyTransAuthError,
     EasyTransNotFoundError,
     EasyTransRateLimitError,
@@ -425,6 +426,34 @@ class TestGetOrder:
         client.get_order(35558)
         assert "/orders/35558" in rsps_lib.calls[0].request.url
 
+    @rsps_lib.activate
+    def test_stdlib_json_fallback(self, client, monkeypatch):
+        monkeypatch.setattr("easytrans.client._orjson", None)
+        rsps_lib.add(
+            rsps_lib.GET,
+            f"{REST_BASE}/orders/35558",
+            json={"data": MINIMAL_ORDER},
+            status=200,
+        )
+        order = client.get_order(35558)
+        assert order.attributes.order_no == 35558
+
+    @pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib"])
+    @rsps_lib.activate
+    def test_malformed_json_body_raises_api_error(self, client, monkeypatch, use_orjson):
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr("easytrans.client._orjson", None)
+        rsps_lib.add(
+            rsps_lib.GET,
+            f"{REST_BASE}/orders/35558",
+            body="not json {{{",
+            status=200,
+        )
+        with pytest.raises(EasyTransAPIError, match="Invalid JSON in REST response"):
+            client.get_order(35558)
+
     @rsps_lib.activate
     def test_not_found_raises(self, client):
         rsps_lib.add(
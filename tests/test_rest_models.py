@@ -7,6 +7,7 @@ No network calls are made.
 """
 
 import datetime
+import sys
 
 import pytest
 
@@ -361,6 +362,38 @@ class TestPagedResponse:
         assert response.data == []
         assert response.has_next is False
 
+    def test_missing_links_and_meta_use_read_only_fallback(self):
+        response = PagedResponse.from_dict({"data": []}, RestOrder)
+        assert response.links == PaginationLinks()
+        assert response.meta == PaginationMeta()
+        with pytest.raises(TypeError):
+            response._links_raw["next"] = "http://localhost/v1/orders?page=2"
+
+    def test_links_and_meta_built_lazily(self):
+        response = PagedResponse.from_dict(ORDER_LIST_RESPONSE, RestOrder)
+        assert response._links is None
+        assert response._meta is None
+        assert response.links is response.links
+        assert response.meta is response.meta
+
+    def test_next_url(self):
+        data = {
+            **ORDER_LIST_RESPONSE,
+            "links": {**ORDER_LIST_RESPONSE["links"], "next": "http://localhost/v1/orders?page=2"},
+        }
+        response = PagedResponse.from_dict(data, RestOrder)
+        assert response.next_url == "http://localhost/v1/orders?page=2"
+        assert response._links is None
+
+    def test_direct_construction(self):
+        links = PaginationLinks(next="http://localhost/v1/orders?page=2")
+        response = PagedResponse(data=[], links=links, meta=PaginationMeta(), has_next=True)
+        assert response.links is links
+        assert response.next_url == links.next
+        assert response == PagedResponse(
+            data=[], links=PaginationLinks(next=links.next), meta=PaginationMeta(), has_next=True
+        )
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Shared sub-models
@@ -428,8 +461,8 @@ class TestRestDestination:
 
     def test_empty_lists(self):
         dest = RestDestination.from_dict(DESTINATION_DATA)
-        assert dest.photos == []
-        assert dest.documents == []
+        assert dest.photos == ()
+        assert dest.documents == ()
 
     def test_date_parsed_valid(self):
         dest = RestDestination.from_dict(DESTINATION_DATA)
@@ -583,13 +616,13 @@ class TestRestCustomer:
         assert customer.contacts[0].name == "Kevin van Beek"
         assert customer.contacts[0].username == "kvanbeek"
 
-    def test_contacts_empty_dict_yields_empty_list(self):
+    def test_contacts_empty_dict_yields_empty_tuple(self):
         data = {
             **CUSTOMER_DATA,
             "attributes": {**CUSTOMER_DATA["attributes"], "contacts": {}},
         }
         customer = RestCustomer.from_dict(data)
-        assert customer.contacts == []
+        assert customer.contacts == ()
 
     def test_contacts_already_list_still_works(self):
         """Existing list-form must continue to deserialise correctly."""
@@ -656,13 +689,13 @@ class TestRestCarrier:
         assert carrier.contacts[0].name == "Contact one"
         assert carrier.contacts[0].username == "import"
 
-    def test_contacts_empty_dict_yields_empty_list(self):
+    def test_contacts_empty_dict_yields_empty_tuple(self):
         data = {
             **CARRIER_DATA,
             "attributes": {**CARRIER_DATA["attributes"], "contacts": {}},
         }
         carrier = RestCarrier.from_dict(data)
-        assert carrier.contacts == []
+        assert carrier.contacts == ()
 
     def test_contacts_already_list_still_works(self):
         """Existing list-form must continue to deserialise correctly."""
@@ -700,6 +733,14 @@ class TestRestOrderAttributes:
         assert len(attrs.goods) == 1
         assert attrs.goods[0].amount == 16
 
+    def test_collections_are_tuples(self):
+        attrs = RestOrderAttributes.from_dict(ORDER_DATA["attributes"])
+        assert isinstance(attrs.destinations, tuple)
+        assert isinstance(attrs.goods, tuple)
+        assert isinstance(attrs.sales_rates, tuple)
+        assert isinstance(attrs.track_history, tuple)
+        assert RestOrderAttributes().destinations == ()
+
     def test_embedded_customer(self):
         attrs = RestOrderAttributes.from_dict(ORDER_DATA["attributes"])
         assert attrs.customer is not None
@@ -717,7 +758,7 @@ class TestRestOrderAttributes:
 
     def test_empty_purchase_rates(self):
         attrs = RestOrderAttributes.from_dict(ORDER_DATA["attributes"])
-        assert attrs.purchase_rates == []
+        assert attrs.purchase_rates == ()
 
     def test_track_history(self):
         attrs = RestOrderAttributes.from_dict(ORDER_DATA["attributes"])
@@ -770,6 +811,12 @@ class TestRestOrder:
         assert order.attributes.customer is None
         assert order.attributes.carrier is None
 
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10+")
+    def test_instances_use_slots(self):
+        order = RestOrder.from_dict(ORDER_DATA)
+        assert not hasattr(order, "__dict__")
+        assert not hasattr(order.attributes.destinations[0], "__dict__")
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Reference data